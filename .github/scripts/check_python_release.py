@@ -4,15 +4,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import pathlib
 import json
+import re
 import subprocess
 import sys
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+try:  # Optional, faster JSON parsing
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 try:  # Python 3.11+
     import tomllib  # type: ignore[attr-defined]
 except ModuleNotFoundError:  # pragma: no cover
@@ -22,45 +31,61 @@ except ModuleNotFoundError:  # pragma: no cover
         tomllib = None  # type: ignore[assignment]
 
 PYPROJECT_PATH = pathlib.Path("pyproject.toml")
+PYPI_SIMPLE_JSON = "application/vnd.pypi.simple.v1+json"
+RELEASE_VERSION_RE = re.compile(r"^\d+(\.\d+)*$")
+# Fallback parsing: body of the [project] table up to the next table header
+PROJECT_TABLE_RE = re.compile(r"^[ \t]*\[project\][ \t]*(?:#[^\n]*)?$(.*?)(?=^[ \t]*\[|\Z)", re.M | re.S)
+PROJECT_FIELD_RE = re.compile(r"^[ \t]*(name|version)[ \t]*=[ \t]*[\"']([^\"']+)[\"']", re.M)
+
+
+def project_string_fields(toml_text: str) -> Dict[str, str]:
+    """Extract the plain string name/version fields of [project] using regexes only."""
+    table = PROJECT_TABLE_RE.search(toml_text)
+    return dict(PROJECT_FIELD_RE.findall(table.group(1))) if table else {}
+
+
+def quick_name_version(toml_text: str) -> Optional[tuple[str, str]]:
+    """Return (name, version) without a full TOML parse, or None if either is missing."""
+    fields = project_string_fields(toml_text)
+    name = fields.get("name")
+    version = fields.get("version")
+    if name is None or version is None:
+        return None
+    return name, version
+
 
+@functools.lru_cache(maxsize=8)
+def parse_project_table(toml_text: str) -> Mapping[str, object]:
+    """Parse [project] table using tomllib when available, otherwise a tiny regex parser.
 
-def parse_project_table(toml_text: str) -> Dict[str, object]:
-    """Parse [project] table using tomllib when available, otherwise a tiny parser."""
+    Results are cached per input text and returned as read-only mappings.
+    """
     if tomllib is not None:
         data = tomllib.loads(toml_text)
         project = data.get("project")
         if isinstance(project, dict):
-            return project
+            return MappingProxyType(project)
         raise RuntimeError("Missing [project] table in pyproject.toml")
 
-    in_project = False
-    project: Dict[str, object] = {}
-    for raw_line in toml_text.splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("[") and line.endswith("]"):
-            in_project = line == "[project]"
-            continue
-        if not in_project or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip()
-        if value.startswith(("'", '"')) and value.endswith(("'", '"')) and len(value) >= 2:
-            value = value[1:-1]
-        project[key] = value
+    # The fallback only extracts the string fields this script needs
+    project: Dict[str, object] = dict(project_string_fields(toml_text))
 
     if not project:
         raise RuntimeError("Missing [project] table in pyproject.toml")
-    return project
+    return MappingProxyType(project)
 
 
+@functools.lru_cache(maxsize=None)
 def load_pyproject(path: pathlib.Path) -> tuple[str, str]:
     if not path.exists():
         raise RuntimeError(f"{path} not found")
 
-    project = parse_project_table(path.read_text(encoding="utf-8"))
+    toml_text = path.read_text(encoding="utf-8")
+    quick = quick_name_version(toml_text)
+    if quick is not None:
+        return quick
+
+    project = parse_project_table(toml_text)
 
     try:
         name = project["name"]  # type: ignore[index]
@@ -74,73 +99,103 @@ def load_pyproject(path: pathlib.Path) -> tuple[str, str]:
     return name, version
 
 
+def latest_release_version(versions: Iterable[object]) -> Optional[str]:
+    """Return the highest final release (e.g. 1.3.1) from a list of versions."""
+    releases = [v for v in versions if isinstance(v, str) and RELEASE_VERSION_RE.match(v)]
+    if not releases:
+        return None
+    return max(releases, key=lambda v: tuple(int(part) for part in v.split(".")))
+
+
 def fetch_pypi_version(package_name: str) -> Optional[str]:
-    url = f"https://pypi.org/pypi/{package_name}/json"
-    request = Request(url, headers={"Accept": "application/json"})
+    """Return the latest released version using PyPI's JSON simple index (PEP 691/700)."""
+    url = f"https://pypi.org/simple/{package_name}/"
+    request = Request(url, headers={"Accept": PYPI_SIMPLE_JSON})
     try:
         with urlopen(request, timeout=10) as response:
-            data = json.load(response)
+            body = response.read()
+        data = orjson.loads(body) if orjson is not None else json.loads(body)
     except HTTPError as err:
         if err.code == 404:
             return None
         raise RuntimeError(f"PyPI responded with HTTP {err.code}") from err
     except URLError as err:
         raise RuntimeError(f"Unable to reach PyPI: {err}") from err
+    except ValueError as err:
+        raise RuntimeError(f"PyPI returned invalid JSON: {err}") from err
 
-    info = data.get("info") or {}
-    version = info.get("version")
-    return version if isinstance(version, str) and version.strip() else None
+    versions = data.get("versions")
+    if not isinstance(versions, list):
+        return None
+    return latest_release_version(versions)
+
+
+@functools.lru_cache(maxsize=None)
+def _git(args: tuple[str, ...]) -> str:
+    """Run git once per unique argument tuple and return its stdout."""
+    result = subprocess.run(("git", *args), text=True, capture_output=True, check=True)
+    return result.stdout
 
 
 def read_previous_pyproject_version() -> Optional[str]:
-    """Return the previously committed version from git history."""
+    """Return the previously committed version from git history.
+
+    The pyproject.toml blob of HEAD^ is resolved first; its contents are then
+    read by blob hash, so an unchanged file is only read from git once.
+    """
     try:
-        commit = (
-            subprocess.check_output(
-                ("git", "rev-list", "-n", "1", "HEAD^", "--", "pyproject.toml"),
-                text=True,
-                stderr=subprocess.DEVNULL,
-            )
-            .strip()
-        )
+        blob = _git(("rev-parse", "--verify", "--quiet", "HEAD^:pyproject.toml")).strip()
     except subprocess.CalledProcessError:
         return None
 
-    if not commit:
+    if not blob:
         return None
 
     try:
-        contents = subprocess.check_output(
-            ("git", "show", f"{commit}:pyproject.toml"),
-            text=True,
-            stderr=subprocess.DEVNULL,
-        )
+        contents = _git(("cat-file", "blob", blob))
     except subprocess.CalledProcessError:
         return None
 
+    quick = quick_name_version(contents)
+    if quick is not None:
+        return quick[1]
+
     project = parse_project_table(contents)
     version = project.get("version")  # type: ignore[index]
     return version if isinstance(version, str) else None
 
 
-def determine_reference_version(package_name: str) -> tuple[Optional[str], str]:
-    """Return (version, source) for comparison."""
-    try:
-        pypi_version = fetch_pypi_version(package_name)
-    except RuntimeError as err:
-        print(f"Warning: {err}. Falling back to git history.", file=sys.stderr)
-        pypi_version = None
+async def determine_reference_version_async(package_name: str) -> tuple[Optional[str], str]:
+    """Return (version, source) for comparison, querying PyPI and git concurrently."""
+    pypi_result, git_result = await asyncio.gather(
+        asyncio.to_thread(fetch_pypi_version, package_name),
+        asyncio.to_thread(read_previous_pyproject_version),
+        return_exceptions=True,
+    )
+
+    if isinstance(pypi_result, RuntimeError):
+        print(f"Warning: {pypi_result}. Falling back to git history.", file=sys.stderr)
+        pypi_result = None
+    elif isinstance(pypi_result, BaseException):
+        raise pypi_result
 
-    if pypi_version:
-        return pypi_version, "PyPI"
+    if pypi_result:
+        return pypi_result, "PyPI"
 
-    git_version = read_previous_pyproject_version()
-    if git_version:
-        return git_version, "git history"
+    # The git lookup only matters when PyPI had no answer
+    if isinstance(git_result, BaseException):
+        raise git_result
+    if git_result:
+        return git_result, "git history"
 
     return None, "<unknown>"
 
 
+def determine_reference_version(package_name: str) -> tuple[Optional[str], str]:
+    """Return (version, source) for comparison."""
+    return asyncio.run(determine_reference_version_async(package_name))
+
+
 def main() -> int:
     package_name, local_version = load_pyproject(PYPROJECT_PATH)
     reference_version, reference_source = determine_reference_version(package_name)
@@ -5,13 +5,16 @@
  - Assigns the agent a visual identifier (icon + color).
  - Demonstrates basic moves: right, left, up, down, and a jump.
  - Then loops forever, making the agent walk in a square.
+ - Optional flags: `--pause SECONDS` waits between the demo moves,
+   `--rate HZ` limits how many moves per second the square walk makes.
  
  - The goal is to show how to connect, control movement, 
    and run continuous actions.
 """
 
+import argparse
 import time
-from typing import Tuple
+from typing import Optional, Tuple
 
 from remote_explorer_game import (
     RemoteGameSessionFactory, RemoteGameSession,
@@ -19,13 +22,36 @@ from remote_explorer_game import (
 )
 
 
-def move_n_times(n: int, movement: Tuple[int, int], session: RemoteGameSession) -> None:
-    """Move the agent `n` times by the same vector, with a small pause between moves."""
+def move_n_times(
+    n: int,
+    movement: Tuple[int, int],
+    session: RemoteGameSession,
+    rate_hz: Optional[float] = None,
+) -> None:
+    """
+    Move the agent `n` times by the same vector.
+    If `rate_hz` is set, make at most `rate_hz` moves per second.
+    """
+    interval = 1.0 / rate_hz if rate_hz else 0.0
+    next_move_at = time.monotonic()
     for _ in range(n):
         session.move(movement)
+        if interval:
+            # Schedule from the previous deadline, so the time spent in move() counts too
+            next_move_at += interval
+            delay = next_move_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Simple movement of an agent")
+    parser.add_argument("--pause", type=float, default=0.0,
+                        help="seconds to wait between the demo moves (default: 0)")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="max moves per second while walking in a square (default: unlimited)")
+    args = parser.parse_args()
+
     # Prepare an object ("factory") that helps us create agents and connect to them
     address = "http://127.0.0.1:8080/"
     username = "Example"
@@ -42,24 +68,24 @@ def main() -> None:
 
     # Demonstrate basic moves (dx, dy):
     session.move((1, 0))   # Move right
-    time.sleep(0.5)
+    time.sleep(args.pause)
     session.move((-1, 0))  # Move left
-    time.sleep(0.5)
+    time.sleep(args.pause)
     session.move((0, 1))   # Move up
-    time.sleep(0.5)
+    time.sleep(args.pause)
     session.move((0, -1))  # Move down
-    time.sleep(0.5)
+    time.sleep(args.pause)
 
     session.move((2, 0))   # Jump right (step of 2)
-    time.sleep(0.5)
+    time.sleep(args.pause)
 
     # Walk in a square forever
     try:
         while True:
-            move_n_times(4, (1, 0), session)   # right ×4
-            move_n_times(4, (0, 1), session)   # up ×4
-            move_n_times(4, (-1, 0), session)  # left ×4
-            move_n_times(4, (0, -1), session)  # down ×4
+            move_n_times(4, (1, 0), session, args.rate)   # right ×4
+            move_n_times(4, (0, 1), session, args.rate)   # up ×4
+            move_n_times(4, (-1, 0), session, args.rate)  # left ×4
+            move_n_times(4, (0, -1), session, args.rate)  # down ×4
     except KeyboardInterrupt:
         print("Stopped by user.")
 
@@ -4,8 +4,8 @@
  - Shows how to manage several agents at the same time.
  - Agents move in random directions, with a higher chance 
    of going right or up.
- - Illustrates automatic recovery: when an agent dies, 
-   a new one is created instantly.
+ - Illustrates automatic recovery: agents that died during 
+   a round are all recreated at once (in parallel threads).
  - The result looks like a swarm of agents wandering the map 
    without stopping.
 
@@ -16,6 +16,7 @@
 
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from remote_explorer_game import (
     RemoteGameSessionFactory,
     SessionIdentifier,
@@ -29,14 +30,15 @@ ADDRESS = "http://127.0.0.1:8080/"
 USERNAME = "Example"
 AGENT_CNT = 5
 
-# Weighted movement options:
-# (1, 0) and (0, 1) appear 3x each to be more likely.
-MOVES = [
-    (1, 0), (1, 0), (1, 0),   # right (higher chance)
-    (0, 1), (0, 1), (0, 1),   # up (higher chance)
-    (-1, 0),                  # left
-    (0, -1),                  # down
-]
+# Movement options and how likely each one is:
+# right (1, 0) and up (0, 1) have weight 3, so they are 3x more likely.
+MOVES = (
+    (1, 0),    # right (higher chance)
+    (0, 1),    # up (higher chance)
+    (-1, 0),   # left
+    (0, -1),   # down
+)
+MOVE_WEIGHTS = (3, 3, 1, 1)
 
 def create_agent(factory: RemoteGameSessionFactory, idx: int) -> RemoteGameSession:
     """
@@ -46,25 +48,42 @@ def create_agent(factory: RemoteGameSessionFactory, idx: int) -> RemoteGameSessi
     vsid = VisualSessionIdentifier(f"[{idx}", Color.Magenta)
     return factory.create(SessionIdentifier(vsid))
 
+def run(factory: RemoteGameSessionFactory, sessions: list[RemoteGameSession],
+        pool: ThreadPoolExecutor) -> None:
+    """
+    Move all agents forever.
+    """
+    while True:
+        # Pick one random move for every agent at once
+        moves = random.choices(MOVES, MOVE_WEIGHTS, k=len(sessions))
+
+        # For each agent, perform its move
+        results: list[MovementResult] = [
+            session.move(moves[i]) for i, session in enumerate(sessions)
+        ]
+
+        # Agents that died during this round are recreated all at once,
+        # so reviving K agents takes about as long as reviving one
+        dead = [i for i, result in enumerate(results) if not result.is_agent_alive]
+        new_sessions = pool.map(lambda i: create_agent(factory, i), dead)
+        for i, session in zip(dead, new_sessions):
+            sessions[i] = session
+
 def main() -> None:
     factory = RemoteGameSessionFactory(ADDRESS, USERNAME)
 
     # Create agents and store their sessions
     sessions: list[RemoteGameSession] = [create_agent(factory, i) for i in range(AGENT_CNT)]
 
-    try:
-        while True:
-            # For each agent, perform one random move
-            for i, session in enumerate(sessions):
-                move = random.choice(MOVES)
-                result: MovementResult = session.move(move)
-
-                # If the agent died during movement, create a new one immediately
-                if not result.is_agent_alive:
-                    sessions[i] = create_agent(factory, i)
+    # Threads used to recreate several dead agents at the same time
+    pool = ThreadPoolExecutor(max_workers=AGENT_CNT)
 
+    try:
+        run(factory, sessions, pool)
     except KeyboardInterrupt:
         print("Stopped by user.")
+    finally:
+        pool.shutdown(wait=False)
 
 
 if __name__ == "__main__":
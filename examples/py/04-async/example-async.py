@@ -1,15 +1,16 @@
 """
- Example: Asynchronous movement and polling
+ Example: Asynchronous movement
 
  - Starts a move asynchronously and continues doing other work.
- - Polls the async handle until the move finishes (non-blocking pattern).
+ - Awaits the async handle, so the program sleeps until the move finishes
+   instead of repeatedly checking it.
  - Reads the final movement result (success + survival) once ready.
 
  - The goal is to demonstrate how to start actions without waiting,
    keep the app responsive, and handle results when they arrive.
 """
 
-import time
+import asyncio
 from remote_explorer_game import (
     RemoteGameSessionFactory,
     SessionIdentifier,
@@ -18,7 +19,7 @@ from remote_explorer_game import (
 )
 
 
-def main() -> None:
+async def main() -> None:
     # Connect to the server and create one agent
     factory = RemoteGameSessionFactory("http://127.0.0.1:8080/", "Example")
     session = factory.create(VisualSessionIdentifier("[]", Color.Magenta))
@@ -33,20 +34,17 @@ def main() -> None:
     # We can keep doing something else while the move is still in progress
     print("Doing something else while the movement completes...")
 
-    # Poll until finished (non-blocking sleep)
-    while not handle.ready:
-        print("Waiting for the movement to finish...")
-        time.sleep(0.02)
+    # Wait until finished. `await` suspends main() without blocking the program,
+    # other async work can run in the meantime.
+    print("Waiting for the movement to finish...")
+    result = await handle
 
     # Now that the move is finished, read the result
-    result = handle.movement_result
-    if result is None:
-        print("No result available (request may have failed).")
-        return
-
     is_alive = result.is_agent_alive        # Did the agent survive?
     move_successful = result.moved_successfully  # Did the move succeed?
     print(f"Alive: {is_alive}, Move was successful: {move_successful}")
 
+    await factory.aclose()
+
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
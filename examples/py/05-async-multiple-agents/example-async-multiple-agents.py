@@ -2,8 +2,8 @@
  Example: Asynchronous movement with multiple agents
 
  - Starts several agents at once and makes them move asynchronously.
- - Each agent picks a random direction from a list (right and up are more likely).
- - Continuously checks if each agent has finished its move.
+ - Each agent runs its own loop: it picks a random direction from a list
+   (right and up are more likely), awaits the move and immediately starts the next one.
  - If an agent dies, it is instantly recreated so the group size stays the same.
  - The result is a swarm of agents moving around at the same time without waiting
    for one another.
@@ -11,6 +11,7 @@
  - The goal is to show how to coordinate many agents in parallel using async moves.
 """
 
+import asyncio
 import random
 from remote_explorer_game import (
     RemoteGameSessionFactory,
@@ -25,54 +26,53 @@ ADDRESS = "http://127.0.0.1:8080/"
 USERNAME = "Example"
 AGENT_CNT = 5
 
-# Weighted moves: right and up appear 3x to be more likely
-MOVES = [
-    (1, 0), (1, 0), (1, 0),   # right
-    (0, 1), (0, 1), (0, 1),   # up
-    (-1, 0),                  # left
-    (0, -1),                  # down
-]
+# Moves and their weights: right and up are 3x more likely
+MOVES = (
+    (1, 0),    # right
+    (0, 1),    # up
+    (-1, 0),   # left
+    (0, -1),   # down
+)
+MOVE_WEIGHTS = (3, 3, 1, 1)
+
+# How many random moves an agent draws at once
+MOVE_BATCH = 64
 
 
-def create_agent(factory: RemoteGameSessionFactory, idx: int) -> RemoteGameSession:
+async def create_agent(factory: RemoteGameSessionFactory, idx: int) -> RemoteGameSession:
     """
     Create an agent with a unique two-character identifier like "[0", "[1", ...
     """
     vsid = VisualSessionIdentifier(f"[{idx}", Color.Magenta)
-    return factory.create(SessionIdentifier(vsid))
+    return await factory.create_async(SessionIdentifier(vsid))
 
 
-def main() -> None:
-    factory = RemoteGameSessionFactory(ADDRESS, USERNAME)
+async def agent_loop(factory: RemoteGameSessionFactory, idx: int) -> None:
+    """
+    Move one agent forever. While this agent waits for the server,
+    the other agents' loops keep running.
+    """
+    session = await create_agent(factory, idx)
+    while True:
+        # Draw a batch of random moves at once, then walk through them
+        for move in random.choices(MOVES, MOVE_WEIGHTS, k=MOVE_BATCH):
+            result: MovementResult = await session.move_async(move)
 
-    # Create initial agents and their first async moves
-    sessions: list[RemoteGameSession] = [create_agent(factory, i) for i in range(AGENT_CNT)]
-    handles = []
-    for i in range(AGENT_CNT):
-        move = random.choice(MOVES)
-        handle = sessions[i].move_async(move)  # returns immediately; no event loop needed
-        handles.append(handle)
+            # If agent died, recreate it
+            if not result.is_agent_alive:
+                session = await create_agent(factory, idx)
 
-    try:
-        while True:
-            # Check each agent's async handle
-            for i in range(AGENT_CNT):
-                handle = handles[i]
-                if not handle.ready:
-                    continue  # still moving
-
-                result: MovementResult | None = handle.movement_result
-                # If agent died, recreate it
-                if result is None or not result.is_agent_alive:
-                    sessions[i] = create_agent(factory, i)
-
-                # Start a new async move for this agent
-                next_move = random.choice(MOVES)
-                handles[i] = sessions[i].move_async(next_move)
 
-    except KeyboardInterrupt:
-        print("Stopped by user.")
+async def main() -> None:
+    factory = RemoteGameSessionFactory(ADDRESS, USERNAME)
+
+    # Run all agent loops at the same time. All of them share the factory's
+    # connection pool, so the number of agents is also the number of moves in flight.
+    await asyncio.gather(*(agent_loop(factory, i) for i in range(AGENT_CNT)))
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("Stopped by user.")
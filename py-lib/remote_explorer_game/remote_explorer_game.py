@@ -2,12 +2,57 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional, Sequence, Tuple, Union, overload
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, ClassVar, Dict, Iterable, List, Optional, Sequence, Tuple, Union, overload
 
 import httpx
-import numpy as np
 import asyncio
+import concurrent.futures
+import importlib.util
+import json
+import sys
 import threading
+import weakref
+
+try:  # Optional speedup: pip install remote-explorer-game[fast]
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+
+def _loads(resp: httpx.Response) -> Any:
+    """
+    Decode a JSON response body.
+
+    The server always sends UTF-8 JSON, so the raw bytes go straight to the decoder,
+    skipping httpx's text decoding and charset detection in Response.json().
+    """
+    return _json_loads(resp.content)
+
+
+if TYPE_CHECKING:
+    # numpy is imported lazily: only callers that pass arrays (and so have it loaded) need it
+    import numpy as np
+
+# HTTP/2 needs the optional h2 package: pip install remote-explorer-game[http2].
+# With it, concurrent moves over HTTPS share (multiplex) a single connection.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_JSON_HEADERS = {"content-type": "application/json"}
+_MOVE_HEADERS = {"content-type": "application/json", "accept": "application/json"}
+
+# Pool settings of a standalone session's own client; idle connections are kept for 30 s
+_SESSION_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+)
 
 # ==============================
 # Colors
@@ -37,7 +82,8 @@ class Color(Enum):
     White = "White"
 
     def __str__(self) -> str:
-        return self.value
+        # Read the member's stored value directly instead of going through the `value` descriptor
+        return self._value_
 
 
 # ==============================
@@ -51,9 +97,15 @@ class Tile:
 
     Create from a 2-character string (e.g., "AB") or a tuple of two single-character strings.
     """
+    __slots__ = ("left", "right")
+
     left: str
     right: str
 
+    # Tiles are immutable and the server only sends a few distinct ones, so from_json shares them
+    _INTERN: ClassVar[Dict[str, "Tile"]] = {}
+    _INTERN_MAX: ClassVar[int] = 256
+
     def __init__(self, data: Union[str, Tuple[str, str]]):
         if isinstance(data, str):
             if len(data) != 2:
@@ -66,6 +118,10 @@ class Tile:
         object.__setattr__(self, "left", left)
         object.__setattr__(self, "right", right)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Frozen + __slots__ cannot restore state via setattr; rebuild from the 2-char string
+        return (Tile, (str(self),))
+
     def __repr__(self) -> str:
         return f"Tile({self.left}{self.right})"
 
@@ -87,14 +143,39 @@ class Tile:
         s = obj.get("str")
         if s is None or len(s) != 2:
             raise ValueError("Invalid tile JSON: missing/invalid 'str'.")
-        return Tile(s)
+        intern = Tile._INTERN
+        tile = intern.get(s)
+        if tile is None:
+            tile = Tile(s)
+            if len(intern) >= Tile._INTERN_MAX:
+                intern.pop(next(iter(intern)), None)  # drop the oldest entry
+            intern[s] = tile
+        return tile
+
+    @staticmethod
+    def from_json_batch(objs: Sequence[Optional[Dict[str, Any]]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Deserialize many tiles at once without creating Tile objects.
+
+        Returns:
+            (tiles, mask): `tiles` is a numpy array of 2-character strings (dtype "U2",
+            "" where there is no tile) and `mask` is a bool array, True where a tile is present.
+        """
+        import numpy as np
+
+        # U3 keeps one extra character so over-long strings fail the length check
+        tiles = np.array([o.get("str", "") if o is not None else "" for o in objs], dtype="U3")
+        mask = np.fromiter((o is not None for o in objs), dtype=bool, count=len(objs))
+        if np.any(np.char.str_len(tiles[mask]) != 2):
+            raise ValueError("Invalid tile JSON: missing/invalid 'str'.")
+        return tiles.astype("U2"), mask
 
 
 # ==============================
 # Movement result
 # ==============================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class MovementResult:
     """
     Outcome of a movement attempt.
@@ -108,31 +189,72 @@ class MovementResult:
     is_agent_alive: bool
     discovered_tile: Optional[Tile] = None
 
-@dataclass
+@dataclass(eq=False)
 class AsyncMovementResult:
     """
     Async result handle for a movement request.
 
+    The handle is awaitable: inside a coroutine, `result = await handle` suspends
+    until the move finishes and returns its MovementResult, so there is no need
+    to poll `ready`.
+
     Attributes:
-        ready: True when movement_result is available.
-        movement_result: The parsed MovementResult once ready.
+        future: asyncio.Task if scheduled on a running loop, otherwise a
+            concurrent.futures.Future completed on the background event loop.
+        ready: True when the move has finished.
+        movement_result: The parsed MovementResult once ready; None while pending
+            or if the move was cancelled or raised.
         task: asyncio.Task if scheduled on a running loop, otherwise None.
     """
-    def __init__(self) -> None:
-        self.ready: bool = False
-        self.movement_result: Optional[MovementResult] = None
-        self.task: Optional[asyncio.Task] = None
-        self._done = threading.Event()
+    __slots__ = ("future",)
+
+    future: Union["asyncio.Future[MovementResult]", "concurrent.futures.Future[MovementResult]"]
+
+    @property
+    def ready(self) -> bool:
+        return self.future.done()
+
+    @property
+    def movement_result(self) -> Optional[MovementResult]:
+        future = self.future
+        # cancelled() first: exception() raises on a cancelled asyncio future
+        if not future.done() or future.cancelled() or future.exception() is not None:
+            return None
+        return future.result()
+
+    @property
+    def task(self) -> Optional[asyncio.Task]:
+        return self.future if isinstance(self.future, asyncio.Task) else None
 
     def wait(self, timeout: Optional[float] = None) -> Optional[MovementResult]:
-        """Block until finished. Returns the result (or None on timeout)."""
-        finished = self._done.wait(timeout)
-        return self.movement_result if finished else None
+        """
+        Block until finished. Returns the result, or None on timeout, cancellation or error.
+
+        Do not call this from the thread running the move's event loop;
+        await the handle there instead.
+        """
+        if not self.future.done():
+            if isinstance(self.future, concurrent.futures.Future):
+                concurrent.futures.wait((self.future,), timeout)
+            else:
+                done = threading.Event()
+                self.future.get_loop().call_soon_threadsafe(
+                    self.future.add_done_callback, lambda _: done.set()
+                )
+                done.wait(timeout)
+        return self.movement_result
+
+    def __await__(self):
+        """Suspend the awaiting coroutine until finished and return the result."""
+        if isinstance(self.future, concurrent.futures.Future):
+            return asyncio.wrap_future(self.future).__await__()
+        return self.future.__await__()
 
 # ==============================
 # Visual Session Identifier (VSID)
 # ==============================
 
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class VisualSessionIdentifier:
     """
     Visual identifier used to render an agent.
@@ -142,33 +264,18 @@ class VisualSessionIdentifier:
       - color passed through as-is.
 
     All other validation/sanitization is handled by the server.
-    """
-
-    def __init__(self, identifier_str: str, color: Color = Color.White):
-        if len(identifier_str) > 2:
-            raise ValueError("Identifier string can be 2 characters at most.")
-        self._identifier_str = identifier_str
-        self._color = color
+    The identifier is immutable; create a new one to change how an agent looks.
 
-    @property
-    def identifier_str(self) -> str:
-        """Two-character (or shorter) string used for rendering."""
-        return self._identifier_str
+    Attributes:
+        identifier_str: Two-character (or shorter) string used for rendering.
+        color: Console color associated with this visual identifier.
+    """
+    identifier_str: str
+    color: Color = Color.White
 
-    @identifier_str.setter
-    def identifier_str(self, value: str) -> None:
-        if len(value) > 2:
+    def __post_init__(self) -> None:
+        if len(self.identifier_str) > 2:
             raise ValueError("Identifier string can be 2 characters at most.")
-        self._identifier_str = value
-
-    @property
-    def color(self) -> Color:
-        """Console color associated with this visual identifier."""
-        return self._color
-
-    @color.setter
-    def color(self, value: Color) -> None:
-        self._color = value
 
 # ==============================
 # Session Identifier (SID + VSID)
@@ -180,8 +287,10 @@ class SessionIdentifier:
       - sid: server-assigned session ID (set after /connect).
       - vsid: optional visual identifier used for rendering.
 
-    Convenience properties `identifier_str` and `color` proxy to the `vsid`.
+    Convenience properties `identifier_str` and `color` proxy to the `vsid`;
+    setting them replaces `vsid` with an updated VisualSessionIdentifier.
     """
+    __slots__ = ("sid", "vsid")
 
     def __init__(self, vsid: Optional[VisualSessionIdentifier] = None, sid: Optional[str] = None):
         self.sid: Optional[str] = sid
@@ -211,7 +320,7 @@ class SessionIdentifier:
     def identifier_str(self, value: str) -> None:
         if self.vsid is None:
             raise ValueError("No VSID associated with this SessionIdentifier.")
-        self.vsid.identifier_str = value
+        self.vsid = VisualSessionIdentifier(value, self.vsid.color)
 
     @property
     def color(self) -> Color:
@@ -223,7 +332,7 @@ class SessionIdentifier:
     def color(self, value: Color) -> None:
         if self.vsid is None:
             raise ValueError("No VSID associated with this SessionIdentifier.")
-        self.vsid.color = value
+        self.vsid = VisualSessionIdentifier(self.vsid.identifier_str, value)
 
 SessionIdentifierLike = Union[
     "SessionIdentifier",
@@ -259,6 +368,127 @@ def _coerce_session_identifier(value: SessionIdentifierLike) -> Optional["Sessio
         "identifier must be SessionIdentifier | VisualSessionIdentifier | (str, Color) | str | None"
     )
 
+def _prepared_request_parts(
+    client: Union[httpx.Client, httpx.AsyncClient], url: str, headers: Dict[str, str]
+) -> Tuple[httpx.URL, httpx.Headers]:
+    """
+    Return the URL and headers `client` would use for a POST to `url`.
+
+    build_request merges the client's base URL, params and default headers.
+    Content-Length is dropped because each request sets its own, and Cookie because
+    the cookie jar can change later: add it per request with _set_cookies().
+    """
+    request = client.build_request("POST", url, headers=headers)
+    request.headers.pop("content-length", None)
+    request.headers.pop("cookie", None)
+    return request.url, request.headers
+
+
+def _set_cookies(
+    client: Union[httpx.Client, httpx.AsyncClient], request: httpx.Request
+) -> httpx.Request:
+    """Add the client's current cookies to a request built from prepared parts."""
+    cookies = client.cookies
+    if cookies:
+        cookies.set_cookie_header(request)
+    return request
+
+# ==============================
+# Loop-bound async client
+# ==============================
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop that runs move_async calls made outside of a running loop.
+
+    It is started on first use in a daemon thread and kept for the rest of the program,
+    so its pooled async connections are reused across calls.
+    """
+    global _background_loop
+    loop = _background_loop
+    if loop is not None:
+        return loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="remote-explorer-game-loop", daemon=True
+            ).start()
+            _background_loop = loop
+        return _background_loop
+
+
+async def _close_at_loop_shutdown(client: httpx.AsyncClient) -> AsyncIterator[None]:
+    # asyncio.run() (via loop.shutdown_asyncgens()) finalizes suspended async generators
+    # while their loop can still run, so the client is closed on the loop that owns it
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+class _LoopAsyncClient:
+    """
+    Lazily creates a shared httpx.AsyncClient for each running event loop.
+
+    Pooled async connections belong to the loop that opened them, so every loop
+    (e.g. each asyncio.run(), or loops in several threads) gets its own client.
+    A client is only ever closed from its own loop: by aclose() or, at the latest,
+    when that loop shuts down. A caller-provided `client` is returned on the
+    caller's loops and never closed here.
+    """
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, **client_kwargs: Any) -> None:
+        self._client_kwargs = client_kwargs
+        self._fixed_client = client
+        # loop -> (client, closer); the closer is kept because loops track pending
+        # async generators only weakly
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._fixed_client is not None and loop is not _background_loop:
+            return self._fixed_client
+        entry = self._clients.get(loop)
+        if entry is None:
+            client = httpx.AsyncClient(**self._client_kwargs)
+            closer = _close_at_loop_shutdown(client)
+            asyncio.ensure_future(closer.__anext__())
+            entry = (client, closer)
+            with self._lock:
+                # Loops that ended without shutting down async generators leave entries behind
+                for closed in [other for other in self._clients if other.is_closed()]:
+                    del self._clients[closed]
+                self._clients[loop] = entry
+        return entry[0]
+
+    async def aclose(self) -> None:
+        """Close the client of the running loop, if one was created."""
+        with self._lock:
+            entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].aclose()
+
+    def close(self) -> None:
+        """
+        Close the client used on the background loop, if one was created.
+
+        Clients of other running loops can only be closed from their loop: use aclose().
+        """
+        loop = _background_loop
+        if loop is None:
+            return
+        with self._lock:
+            entry = self._clients.pop(loop, None)
+        if entry is not None:
+            asyncio.run_coroutine_threadsafe(entry[0].aclose(), loop).result()
+
 # ==============================
 # Remote game session
 # ==============================
@@ -268,16 +498,83 @@ class RemoteGameSession:
     Remote game session bound to a server.
 
     Provides synchronous and asynchronous methods to move the agent.
+
+    Sessions created by RemoteGameSessionFactory share the factory's pooled
+    HTTP clients, so consecutive moves reuse open keep-alive connections.
+    A session constructed without `client`/`async_client` creates and owns its
+    own pooled clients; close()/aclose() (or using the session as a context
+    manager) only close clients the session owns. A caller-provided `async_client`
+    sends move_async requests inside the caller's event loop, and its base URL,
+    params, default headers and cookies apply to every move_async request.
     """
 
-    def __init__(self, server_url: str, sid: str, *, timeout: Optional[float] = 10.0):
+    def __init__(
+        self,
+        server_url: str,
+        sid: str,
+        *,
+        timeout: Optional[float] = 10.0,
+        client: Optional[httpx.Client] = None,
+        async_client: Optional[httpx.AsyncClient] = None,
+        _loop_client: Optional[_LoopAsyncClient] = None,
+    ):
         self.server_url = server_url.rstrip("/")
         self.sid = sid
-        self._sync_client = httpx.Client(timeout=timeout)
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.Client(timeout=timeout, limits=_SESSION_LIMITS, http2=_HTTP2)
+        self._sync_client = client
+        # The factory shares its own per-loop wrapper through _loop_client
+        self._owns_async_client = _loop_client is None
+        if _loop_client is None:
+            # Clients are created lazily on the first move_async inside an event loop
+            _loop_client = _LoopAsyncClient(
+                async_client, timeout=timeout, limits=_SESSION_LIMITS, http2=_HTTP2
+            )
+        self._async_client = _loop_client
+        # Encoded body up to the move vector: {"sid":"...","dx":
+        # Encoding the sid as JSON escapes any characters that would break the body.
+        self._move_body_prefix = _json_dumps({"sid": sid})[:-1] + b',"dx":'
+        self._move_request = self._make_move_request(client)
+        # A caller-provided async client's base URL, params, headers and cookies apply
+        # to move_async; otherwise async moves carry the sync client's
+        self._async_move_request = (
+            self._make_move_request(async_client) if async_client is not None else self._move_request
+        )
         self.last_response_message: Optional[str] = None
         self.is_agent_alive: bool = True
         self._discovered_tile: Optional[Tile] = None
 
+    def __enter__(self) -> "RemoteGameSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "RemoteGameSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """
+        Close the HTTP clients if this session created them; shared clients are left open.
+
+        An async client bound to a running event loop is closed by aclose() (or when
+        asyncio.run() finishes), not here.
+        """
+        if self._owns_async_client:
+            self._async_client.close()
+        if self._owns_client:
+            self._sync_client.close()
+
+    async def aclose(self) -> None:
+        """Close the sync and async HTTP clients this session created."""
+        if self._owns_async_client:
+            await self._async_client.aclose()
+        self.close()
+
     @property
     def discovered_tile(self) -> Optional[Tile]:
         """Tile discovered by the last move, if any."""
@@ -285,25 +582,68 @@ class RemoteGameSession:
 
     @staticmethod
     def _normalize_move(move: Union[np.ndarray, Sequence[int]]) -> Tuple[int, int]:
-        arr = np.array(move, dtype=int) if not isinstance(move, np.ndarray) else move
-        if arr.shape != (2,):
-            raise ValueError(f"move must be a length-2 sequence/array, got shape {arr.shape}")
-        return int(arr[0]), int(arr[1])
+        # Plain tuples/lists (the common case) are unpacked without building an ndarray
+        if isinstance(move, (tuple, list)):
+            if len(move) != 2:
+                raise ValueError(f"move must be a length-2 sequence/array, got length {len(move)}")
+            return int(move[0]), int(move[1])
+        # An ndarray can only exist if numpy is already imported
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(move, np.ndarray):
+            if move.shape != (2,):
+                raise ValueError(f"move must be a length-2 sequence/array, got shape {move.shape}")
+            # item() returns a Python scalar directly, without boxing a numpy scalar first
+            return int(move.item(0)), int(move.item(1))
+        items = tuple(move)
+        if len(items) != 2:
+            raise ValueError(f"move must be a length-2 sequence/array, got length {len(items)}")
+        return int(items[0]), int(items[1])
 
-    def _parse_move_response(self, payload: Dict[str, Any]) -> MovementResult:
-        self.last_response_message = payload.get("message")
-        discovered_obj = payload.get("discovered")
-        discovered_tile = Tile.from_json(discovered_obj) if discovered_obj is not None else None
-        self._discovered_tile = discovered_tile
+    @staticmethod
+    def _normalize_moves(moves: np.ndarray) -> List[Tuple[int, int]]:
+        import numpy as np
+
+        # The whole (N, 2) array is checked and converted once instead of once per move
+        if moves.ndim != 2 or moves.shape[1] != 2:
+            raise ValueError(f"moves array must have shape (N, 2), got shape {moves.shape}")
+        return [(dx, dy) for dx, dy in moves.astype(np.int64, copy=False).tolist()]
 
-        success = bool(payload.get("success", False))
-        if not success:
+    def _make_move_request(
+        self, client: Union[httpx.Client, httpx.AsyncClient]
+    ) -> Callable[[int, int], httpx.Request]:
+        """
+        Build the function that creates a /move request for (dx, dy) as `client` would.
+
+        Nothing about a /move request except dx/dy changes during a session, so the
+        URL, headers and encoded body prefix are bound once as closure locals and the
+        request is built directly, without the client's per-call URL/header merging.
+        Only the client's cookies are added per request, as the jar can change.
+        """
+        request, set_cookies, prefix = httpx.Request, _set_cookies, self._move_body_prefix
+        url, headers = _prepared_request_parts(client, f"{self.server_url}/move", _MOVE_HEADERS)
+
+        def move_request(dx: int, dy: int) -> httpx.Request:
+            return set_cookies(
+                client,
+                request("POST", url, content=prefix + b'%d,"dy":%d}' % (dx, dy), headers=headers),
+            )
+
+        return move_request
+
+    def _parse_move_response(self, payload: Dict[str, Any]) -> MovementResult:
+        get = payload.get
+        self.last_response_message = get("message")
+        if not get("success"):
+            # A failed request never moved, carries no tile and means there is no living agent
+            self._discovered_tile = None
             self.is_agent_alive = False
-            return MovementResult(False, self.is_agent_alive, discovered_tile)
+            return MovementResult(False, False, None)
 
-        moved = bool(payload.get("moved", False))
-        self.is_agent_alive = bool(payload.get("alive", False))
-        return MovementResult(moved, self.is_agent_alive, discovered_tile)
+        discovered_obj = get("discovered")
+        discovered_tile = Tile.from_json(discovered_obj) if discovered_obj is not None else None
+        self._discovered_tile = discovered_tile
+        alive = self.is_agent_alive = bool(get("alive"))
+        return MovementResult(bool(get("moved")), alive, discovered_tile)
 
     def move(self, move: Union[np.ndarray, Sequence[int]]) -> MovementResult:
         """
@@ -315,59 +655,74 @@ class RemoteGameSession:
         Returns:
             MovementResult with success, alive status, and discovered tile.
         """
-        dx, dy = self._normalize_move(move)
-        resp = self._sync_client.post(f"{self.server_url}/move", json={"sid": self.sid, "dx": dx, "dy": dy})
+        resp = self._sync_client.send(self._move_request(*self._normalize_move(move)))
         resp.raise_for_status()
-        return self._parse_move_response(resp.json())
+        return self._parse_move_response(_loads(resp))
+
+    def move_many(
+        self, moves: Union[np.ndarray, Iterable[Union[np.ndarray, Sequence[int]]]]
+    ) -> List[MovementResult]:
+        """
+        Send several moves one after another.
+
+        The server applies each move separately (with its per-session cooldown), so this
+        still sends one request per move, all over the same pooled connection.
+
+        Args:
+            moves: Iterable of length-2 vectors (dx, dy), or an (N, 2) numpy array.
+
+        Returns:
+            One MovementResult per sent move. Stops after the move that leaves the agent
+            dead, so the list can be shorter than `moves`.
+        """
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(moves, np.ndarray):
+            vectors: Iterable[Tuple[int, int]] = self._normalize_moves(moves)
+        else:
+            vectors = map(self._normalize_move, moves)
+
+        send, move_request, parse = self._sync_client.send, self._move_request, self._parse_move_response
+        results: List[MovementResult] = []
+        for dx, dy in vectors:
+            resp = send(move_request(dx, dy))
+            resp.raise_for_status()
+            result = parse(_loads(resp))
+            results.append(result)
+            if not result.is_agent_alive:
+                break
+        return results
 
     def move_async(self, move: Union[np.ndarray, Sequence[int]]) -> AsyncMovementResult:
         """
         Start a move in the background and return a handle immediately.
 
         - If an asyncio event loop is running in this thread, schedule the HTTP request on it.
-        - Otherwise, run the request on a background thread.
+        - Otherwise, run the request on a shared event loop in a background thread.
+
+        The returned handle can be awaited to get the MovementResult.
         """
         dx, dy = self._normalize_move(move)
-        payload = {"sid": self.sid, "dx": dx, "dy": dy}
-        handle = AsyncMovementResult()
+        request = self._async_move_request(dx, dy)
 
-        async def _runner_async():
+        async def _runner_async() -> MovementResult:
             try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.post(f"{self.server_url}/move", json=payload)
-                    resp.raise_for_status()
-                    result = self._parse_move_response(resp.json())
+                resp = await self._async_client.get().send(request)
+                resp.raise_for_status()
+                result = self._parse_move_response(_loads(resp))
             except Exception as e:
                 self.last_response_message = str(e)
                 result = MovementResult(False, False, None)
-            handle.movement_result = result
-            handle.ready = True
-            handle._done.set()
+            return result
 
-        def _runner_thread():
-            try:
-                with httpx.Client(timeout=self._sync_client.timeout) as client:
-                    resp = client.post(f"{self.server_url}/move", json=payload)
-                    resp.raise_for_status()
-                    result = self._parse_move_response(resp.json())
-            except Exception as e:
-                self.last_response_message = str(e)
-                result = MovementResult(False, False, None)
-            handle.movement_result = result
-            handle.ready = True
-            handle._done.set()
-
-        # Try to use an existing running loop; otherwise fall back to a thread
+        # Try to use an existing running loop; otherwise fall back to the background loop
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
-            t = threading.Thread(target=_runner_thread, daemon=True)
-            t.start()
-            handle.task = None
-        else:
-            handle.task = loop.create_task(_runner_async())
+            return AsyncMovementResult(
+                asyncio.run_coroutine_threadsafe(_runner_async(), _get_background_loop())
+            )
 
-        return handle
+        return AsyncMovementResult(loop.create_task(_runner_async()))
 
 
 # ==============================
@@ -382,39 +737,97 @@ class RemoteGameSessionFactory:
       - POST /connect: body { "vsid": { "identifierStr": str, "color": str } | null,
                               "username": str }
                        -> { "success": bool, "sid": str }
+
+    The factory owns one pooled httpx.Client and one httpx.AsyncClient (per event
+    loop) which are shared by every session it creates. Call close() (or use the
+    factory as a context manager) to release the pooled connections. Pass
+    `limits` to resize the pool, e.g. when many agents move or reconnect at once,
+    or pass your own `client`; the factory never closes a client it did not create.
+
+    A caller-supplied `client` sends every synchronous request. Its base URL,
+    params, default headers and cookies are applied to async requests too, but
+    those still go through the factory's own AsyncClient (built from `timeout`
+    and `limits`), so the client's transport, timeouts and event hooks are not used there.
     """
 
-    def __init__(self, server_url: str, username: str = "unknown", *, timeout: Optional[float] = 10.0):
+    def __init__(
+        self,
+        server_url: str,
+        username: str = "unknown",
+        *,
+        timeout: Optional[float] = 10.0,
+        limits: Optional[httpx.Limits] = None,
+        client: Optional[httpx.Client] = None,
+    ):
         self.server_url = server_url.rstrip("/")
         self.username = username
-        self._sync_client = httpx.Client(timeout=timeout)
+        if limits is None:
+            # Keep idle connections open well past httpx's 5 s default, so pauses
+            # between moves do not cost a new TCP (and TLS) handshake
+            limits = httpx.Limits(
+                max_keepalive_connections=64, max_connections=64, keepalive_expiry=30.0
+            )
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.Client(timeout=timeout, limits=limits, http2=_HTTP2)
+        self._sync_client = client
+        self._async_client = _LoopAsyncClient(timeout=timeout, limits=limits, http2=_HTTP2)
+        # Prepared once, like a session's /move URL and headers
+        self._connect_url, self._connect_headers = _prepared_request_parts(
+            client, f"{self.server_url}/connect", _JSON_HEADERS
+        )
 
-    def create(self, identifier: SessionIdentifierLike = None) -> RemoteGameSession:
+    def __enter__(self) -> "RemoteGameSessionFactory":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "RemoteGameSessionFactory":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def ping(self) -> None:
         """
-        Connect to the server and create a new remote session.
+        Send a lightweight OPTIONS request to keep a pooled connection open.
 
-        Args:
-            identifier: Optional session identifier with a VSID.
+        The server answers it with 404; only the round trip matters. Call it
+        about every 10 s while the program is otherwise idle.
+        """
+        self._sync_client.options(f"{self.server_url}/")
 
-        Returns:
-            A RemoteGameSession bound to the created `sid`.
+    def close(self) -> None:
         """
+        Close the pooled synchronous client shared by the created sessions, if owned,
+        and the async client used by move_async calls made outside of an event loop.
 
-        ident_obj = _coerce_session_identifier(identifier)
+        The async client bound to a running event loop is closed by aclose() (or when
+        asyncio.run() finishes), not here.
+        """
+        self._async_client.close()
+        if self._owns_client:
+            self._sync_client.close()
+
+    async def aclose(self) -> None:
+        """Close both pooled clients shared by the created sessions, if owned."""
+        await self._async_client.aclose()
+        self.close()
 
+    def _connect_body(self, ident_obj: Optional[SessionIdentifier]) -> bytes:
         vsid_payload = None
         if ident_obj is not None and ident_obj.vsid is not None:
-            vsid_payload = {
-                "identifierStr": ident_obj.vsid.identifier_str,
-                "color": str(ident_obj.vsid.color),
-            }
-
-        resp = self._sync_client.post(
-            f"{self.server_url}/connect",
-            json={"vsid": vsid_payload, "username": self.username},
-        )
+            vsid = ident_obj.vsid
+            # The member's stored str goes straight into the encoder, without a __str__ call
+            vsid_payload = {"identifierStr": vsid.identifier_str, "color": vsid.color._value_}
+        return _json_dumps({"vsid": vsid_payload, "username": self.username})
+
+    def _session_from_response(
+        self, resp: httpx.Response, ident_obj: Optional[SessionIdentifier]
+    ) -> RemoteGameSession:
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp)
 
         if not data.get("success", False):
             raise RuntimeError(data.get("message", "Unknown error during session creation."))
@@ -426,4 +839,56 @@ class RemoteGameSessionFactory:
         if ident_obj is not None:
             ident_obj.sid = sid
 
-        return RemoteGameSession(self.server_url, sid)
+        return RemoteGameSession(
+            self.server_url,
+            sid,
+            client=self._sync_client,
+            _loop_client=self._async_client,
+        )
+
+    def create(self, identifier: SessionIdentifierLike = None) -> RemoteGameSession:
+        """
+        Connect to the server and create a new remote session.
+
+        The session sends its moves through this factory's pooled client, so the first
+        move reuses the connection that carried /connect instead of opening a new one.
+
+        Args:
+            identifier: Optional session identifier with a VSID.
+
+        Returns:
+            A RemoteGameSession bound to the created `sid`.
+        """
+
+        ident_obj = _coerce_session_identifier(identifier)
+        resp = self._sync_client.post(
+            self._connect_url,
+            content=self._connect_body(ident_obj),
+            headers=self._connect_headers,
+        )
+        return self._session_from_response(resp, ident_obj)
+
+    async def create_async(self, identifier: SessionIdentifierLike = None) -> RemoteGameSession:
+        """
+        Asynchronous variant of create() that does not block the running event loop.
+
+        As with create(), the session's first move_async on this loop reuses the
+        connection that carried /connect.
+
+        Args:
+            identifier: Optional session identifier with a VSID.
+
+        Returns:
+            A RemoteGameSession bound to the created `sid`.
+        """
+
+        ident_obj = _coerce_session_identifier(identifier)
+        request = httpx.Request(
+            "POST",
+            self._connect_url,
+            content=self._connect_body(ident_obj),
+            headers=self._connect_headers,
+        )
+        # The prepared parts come from the sync client, so its cookies are added here too
+        resp = await self._async_client.get().send(_set_cookies(self._sync_client, request))
+        return self._session_from_response(resp, ident_obj)